@@ -69,6 +69,7 @@ export interface HotZone {
 }
 
 const STREAM_ENDPOINT = '/stream';
+const STREAM_DECODER = new TextDecoder();
 
 function timeframeToMs(timeframe: FilterState['timeframe']): number {
   switch (timeframe) {
@@ -176,9 +177,10 @@ export function useIncidentStream(filters: FilterState) {
   const [connectionNonce, setConnectionNonce] = useState(0);
   const pausedRef = useRef(false);
 
-  const handleMessage = useCallback((event: MessageEvent<string>) => {
+  const handleMessage = useCallback((event: MessageEvent<ArrayBuffer | string>) => {
     try {
-      const payload = JSON.parse(event.data) as RawIncident;
+      const data = typeof event.data === 'string' ? event.data : STREAM_DECODER.decode(event.data);
+      const payload = JSON.parse(data) as RawIncident;
       const incident = normaliseIncident(payload);
       if (!incident) {
         return;
@@ -234,6 +236,7 @@ export function useIncidentStream(filters: FilterState) {
     const protocol = window.location.protocol === 'https:' ? 'wss' : 'ws';
     const url = `${protocol}://${window.location.host}${STREAM_ENDPOINT}`;
     const ws = new WebSocket(url);
+    ws.binaryType = 'arraybuffer';
     wsRef.current = ws;
     ws.addEventListener('message', handleMessage);
     ws.addEventListener('close', () => {
@@ -1,17 +1,40 @@
 """FastAPI application exposing incidents via REST and WebSocket."""
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+import orjson
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from .config import settings
 from .data_ingestor import DataCollector
+from .http_client import close_session
 from .ingest_queue import IngestQueue
 
+logger = logging.getLogger(__name__)
+
+_BROADCAST_RETRY_SECONDS = 1.0
+
+
+class _ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    As ``default_response_class`` this only speeds up the final render: FastAPI still
+    runs ``jsonable_encoder`` over returned data first. Hot endpoints return an instance
+    directly so that pass is skipped.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
 
 class IncidentResponse(BaseModel):
     id: str
@@ -26,9 +49,64 @@ class IncidentResponse(BaseModel):
     audio_url: Optional[str] = None
 
 
+class ConnectionManager:
+    """Track connected WebSocket clients and fan payloads out to them.
+
+    Each client gets a bounded outbox drained by its own writer task, so a slow
+    reader only ever loses its own oldest frames instead of stalling the fanout.
+    """
+
+    def __init__(self, batch_size: int = 50, max_pending: int = 256) -> None:
+        self.clients: Dict[WebSocket, Tuple["asyncio.Queue[bytes]", "asyncio.Task[None]"]] = {}
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+
+    def connect(self, websocket: WebSocket) -> None:
+        outbox: asyncio.Queue[bytes] = asyncio.Queue(maxsize=self.max_pending)
+        writer = asyncio.create_task(self._write(websocket, outbox))
+        self.clients[websocket] = (outbox, writer)
+
+    def disconnect(self, websocket: WebSocket) -> None:
+        entry = self.clients.pop(websocket, None)
+        if entry is not None:
+            entry[1].cancel()
+
+    async def broadcast(self, payload: bytes) -> None:
+        """Queue ``payload`` for every client, yielding to the loop between batches."""
+
+        outboxes = [outbox for outbox, _ in self.clients.values()]
+        for start in range(0, len(outboxes), self.batch_size):
+            for outbox in outboxes[start : start + self.batch_size]:
+                try:
+                    outbox.put_nowait(payload)
+                except asyncio.QueueFull:
+                    try:
+                        outbox.get_nowait()
+                    except asyncio.QueueEmpty:
+                        pass
+                    outbox.put_nowait(payload)
+            await asyncio.sleep(0)
+
+    async def _write(self, websocket: WebSocket, outbox: "asyncio.Queue[bytes]") -> None:
+        try:
+            while True:
+                payload = await outbox.get()
+                await websocket.send_bytes(payload)
+        except Exception:  # client went away mid-send
+            self.clients.pop(websocket, None)
+            # Close with an internal-error code so a half-open client reconnects
+            # instead of waiting on a socket that will never send again.
+            try:
+                await websocket.close(code=1011)
+            except Exception:
+                pass
+
+
 queue = IngestQueue(settings.redis_url, int(settings.retention_window.total_seconds()))
 collector = DataCollector(settings=settings, queue=queue)
-app = FastAPI(title="CrimeTrend API", version="2.0.0")
+manager = ConnectionManager()
+_recent_cache: TTLCache = TTLCache(maxsize=64, ttl=1.0)
+app = FastAPI(title="CrimeTrend API", version="2.0.0", default_response_class=_ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -38,27 +116,76 @@ app.add_middleware(
 )
 
 
+async def _broadcast_incidents() -> None:
+    """Consume the queue once and fan each incident out to all WebSocket clients.
+
+    After a Redis error the read resumes from the last delivered entry, so
+    incidents appended during the reconnect backoff are not skipped.
+    """
+
+    last_id: Optional[bytes] = None
+    while True:
+        try:
+            if last_id is None:
+                last_id = await queue.latest_id()
+            async for entry_id, payload in queue.stream(last_id):
+                last_id = entry_id
+                await manager.broadcast(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Incident broadcaster failed; reconnecting")
+            await asyncio.sleep(_BROADCAST_RETRY_SECONDS)
+
+
 @app.on_event("startup")
 async def _startup() -> None:
     await collector.start()
+    app.state.broadcaster = asyncio.create_task(_broadcast_incidents())
 
 
 @app.on_event("shutdown")
 async def _shutdown() -> None:
+    broadcaster = getattr(app.state, "broadcaster", None)
+    if broadcaster is not None:
+        broadcaster.cancel()
+        await asyncio.gather(broadcaster, return_exceptions=True)
     await collector.stop()
     await queue.close()
+    await close_session()
 
 
 class _QueryParams(BaseModel):
     since: Optional[datetime] = None
 
 
-async def get_recent(params: _QueryParams = Depends()) -> List[IncidentResponse]:
+async def get_recent(params: _QueryParams = Depends()) -> bytes:
     since = params.since
     if since is not None and since.tzinfo is None:
         since = since.replace(tzinfo=timezone.utc)
-    incidents = await queue.get_recent(since)
-    return [IncidentResponse(**incident) for incident in incidents]
+    # Cursors are floored to the second, and the in-flight read is cached rather than
+    # its result, so concurrent polls for the same second share one Redis read and one
+    # rendered body.
+    key = int(since.timestamp()) if since is not None else None
+    read = _recent_cache.get(key)
+    if read is None:
+        floor = datetime.fromtimestamp(key, tz=timezone.utc) if key is not None else None
+        read = asyncio.ensure_future(_read_recent(floor))
+        read.add_done_callback(functools.partial(_evict_failed_read, key))
+        _recent_cache[key] = read
+    # Shield the shared read so one client disconnecting does not cancel it for the rest.
+    return await asyncio.shield(read)
+
+
+async def _read_recent(since: Optional[datetime]) -> bytes:
+    # Entries were encoded by IngestQueue from Incident objects, so they already
+    # match IncidentResponse and are rendered once, without re-validation.
+    return orjson.dumps(list(await queue.get_recent(since)))
+
+
+def _evict_failed_read(key: Optional[int], read: "asyncio.Future[bytes]") -> None:
+    if (read.cancelled() or read.exception() is not None) and _recent_cache.get(key) is read:
+        _recent_cache.pop(key, None)
 
 
 @app.get("/health")
@@ -66,23 +193,26 @@ async def health() -> dict:
     return {"status": "ok"}
 
 
-@app.get("/incidents", response_model=List[IncidentResponse])
-async def incidents_endpoint(items: List[IncidentResponse] = Depends(get_recent)) -> List[IncidentResponse]:
-    return items
+@app.get("/incidents", response_model=None, responses={200: {"model": List[IncidentResponse]}})
+async def incidents_endpoint(body: bytes = Depends(get_recent)) -> Response:
+    # The body is the cached render, so a cache hit neither re-encodes nor walks the rows.
+    return Response(content=body, media_type="application/json")
 
 
 @app.websocket("/stream")
 async def stream(websocket: WebSocket) -> None:
     await websocket.accept()
+    manager.connect(websocket)
     try:
-        async for incident in queue.stream():
-            await websocket.send_json(incident)
-    except WebSocketDisconnect:
-        return
-    except Exception as exc:  # pragma: no cover - runtime logging
-        await websocket.close(code=1011, reason=str(exc))
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
+        manager.disconnect(websocket)
 
 
 @app.exception_handler(Exception)
-async def handle_exception(_, exc: Exception):  # pragma: no cover - global safety net
-    raise HTTPException(status_code=500, detail=str(exc))
+async def handle_exception(_, exc: Exception) -> _ORJSONResponse:  # pragma: no cover - global safety net
+    # Starlette re-raises after this handler runs, so the server logs the traceback.
+    return _ORJSONResponse({"detail": "internal error"}, status_code=500)
@@ -1,9 +1,10 @@
 """Optional Broadcastify integration helpers."""
 from __future__ import annotations
 
-import aiohttp
 from typing import Optional
 
+from .http_client import get_session
+
 
 class BroadcastifyError(RuntimeError):
     """Raised when the Broadcastify API returns an error."""
@@ -19,26 +20,26 @@ class AudioAdapter:
         """Verify that the provided key can access the Broadcastify API."""
 
         params = {"a": "feeds", "type": "json", "key": api_key}
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.base_url, params=params, timeout=10) as response:
-                if response.status == 401:
-                    return False
-                if response.status >= 400:
-                    raise BroadcastifyError(f"Broadcastify API error {response.status}")
-                payload = await response.json()
+        session = await get_session()
+        async with session.get(self.base_url, params=params, timeout=10) as response:
+            if response.status == 401:
+                return False
+            if response.status >= 400:
+                raise BroadcastifyError(f"Broadcastify API error {response.status}")
+            payload = await response.json()
         return bool(payload.get("feeds"))
 
     async def resolve_audio(self, api_key: str, county_id: str) -> Optional[str]:
         """Fetch the audio URL for a feed if available."""
 
         params = {"a": "feeds", "type": "json", "key": api_key, "countyId": county_id}
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.base_url, params=params, timeout=10) as response:
-                if response.status == 401:
-                    return None
-                if response.status >= 400:
-                    raise BroadcastifyError(f"Broadcastify API error {response.status}")
-                payload = await response.json()
+        session = await get_session()
+        async with session.get(self.base_url, params=params, timeout=10) as response:
+            if response.status == 401:
+                return None
+            if response.status >= 400:
+                raise BroadcastifyError(f"Broadcastify API error {response.status}")
+            payload = await response.json()
         feeds = payload.get("feeds", [])
         if not feeds:
             return None
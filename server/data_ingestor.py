@@ -2,15 +2,21 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from typing import Iterable, List, Mapping, Optional
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, List, Mapping, Optional, Tuple
 
 import aiohttp
 
 from .config import Settings
+from .http_client import get_session
 from .ingest_queue import IngestQueue
 from .normalizer import IncidentNormalizer
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class DataSource:
@@ -19,11 +25,30 @@ class DataSource:
     name: str
     url: str
     interval: int
+    _etag: Optional[str] = field(default=None, init=False, repr=False)
+    _last_modified: Optional[str] = field(default=None, init=False, repr=False)
+    _pending_validators: Optional[Tuple[Optional[str], Optional[str]]] = field(
+        default=None, init=False, repr=False
+    )
 
     async def fetch(self, session: aiohttp.ClientSession) -> Iterable[Mapping[str, object]]:
-        async with session.get(self.url, timeout=20) as response:
+        """Fetch the feed, returning no records when it is unchanged since the last poll.
+
+        Validators from a fresh response are held as pending until
+        :meth:`commit_validators` confirms its records were ingested.
+        """
+
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        async with session.get(self.url, timeout=20, headers=headers) as response:
+            if response.status == 304:
+                return ()
             response.raise_for_status()
             payload = await response.json()
+            self._pending_validators = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
             if isinstance(payload, dict) and "features" in payload and isinstance(payload["features"], list):
                 return payload["features"]
             if isinstance(payload, dict) and "data" in payload and isinstance(payload["data"], list):
@@ -32,6 +57,13 @@ class DataSource:
                 return payload
             return [payload]
 
+    def commit_validators(self) -> None:
+        """Send the last fetched validators on future polls."""
+
+        if self._pending_validators is not None:
+            self._etag, self._last_modified = self._pending_validators
+            self._pending_validators = None
+
 
 class DataCollector:
     """Collect incidents from multiple feeds and push them to the queue."""
@@ -54,7 +86,7 @@ class DataCollector:
     async def start(self) -> None:
         if self._session is not None:
             return
-        self._session = aiohttp.ClientSession()
+        self._session = await get_session()
         self._running.set()
         for source in self.sources:
             task = asyncio.create_task(self._run_source(source))
@@ -66,26 +98,36 @@ class DataCollector:
             task.cancel()
         await asyncio.gather(*self._tasks, return_exceptions=True)
         self._tasks.clear()
-        if self._session:
-            await self._session.close()
-            self._session = None
+        self._session = None
 
     async def _run_source(self, source: DataSource) -> None:
         assert self._session is not None
+        # Stagger sources so they do not all hit upstream APIs and Redis at once.
+        await asyncio.sleep(random.uniform(0, source.interval))
+        next_tick = time.monotonic()
         while self._running.is_set():
+            # Schedule from the previous tick to avoid drift, but never try to catch up
+            # on ticks missed by a slow fetch.
+            next_tick = max(next_tick, time.monotonic()) + source.interval
             try:
-                raw_records = await source.fetch(self._session)
-                await self._process_records(source.name, raw_records)
+                await self._poll(source)
             except asyncio.CancelledError:
                 raise
-            except Exception as exc:  # pragma: no cover - logged upstream
-                print(f"[{source.name}] ingestion error: {exc}")
-            await asyncio.sleep(source.interval)
+            except Exception:  # pragma: no cover - keep polling after feed errors
+                logger.exception("[%s] ingestion error", source.name)
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+    async def _poll(self, source: DataSource) -> None:
+        assert self._session is not None
+        raw_records = await source.fetch(self._session)
+        if raw_records:
+            await self._process_records(source.name, raw_records)
+        # Only skip this payload on later polls once it has reached the queue.
+        source.commit_validators()
 
     async def _process_records(self, source: str, records: Iterable[Mapping[str, object]]) -> None:
-        for record in records:
-            incident = self.normalizer.normalize(source, record)
-            await self.queue.push(incident)
+        incidents = self.normalizer.normalize_batch(source, records)
+        await self.queue.push_many(incidents)
 
 
 def build_default_sources(settings: Settings) -> List[DataSource]:
@@ -0,0 +1,32 @@
+"""Shared aiohttp session used for all outbound HTTP calls."""
+from __future__ import annotations
+
+from typing import Optional
+
+import aiohttp
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide client session, creating it on first use."""
+
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session and its pooled connections."""
+
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
@@ -1,67 +1,118 @@
 """Redis-backed queue used for deduplicating and streaming incidents."""
 from __future__ import annotations
 
-import asyncio
-import json
+import time
 from datetime import datetime
-from typing import AsyncIterator, Dict, Iterable, Optional
+from typing import AsyncIterator, Dict, Iterable, Optional, Sequence, Tuple, Union
 
+import msgspec
 from redis import asyncio as redis
 
 from .models import Incident
 
+_ENCODER = msgspec.json.Encoder()
+_DECODER = msgspec.json.Decoder(dict)
+
+# KEYS: stream key, then one dedup key per incident.
+# ARGV: dedup TTL, stream MINID, stream field, then one payload per incident.
+# The entry is appended before its dedup key is set, so a failing XADD never leaves
+# an incident marked as seen without it being stored.
+_PUSH_SCRIPT = """
+local stored = 0
+for i = 2, #KEYS do
+    if redis.call('EXISTS', KEYS[i]) == 0 then
+        redis.call('XADD', KEYS[1], 'MINID', '~', ARGV[2], '*', ARGV[3], ARGV[i + 2])
+        redis.call('SET', KEYS[i], 1, 'EX', ARGV[1])
+        stored = stored + 1
+    end
+end
+return stored
+"""
+
 
 class IngestQueue:
     """Manage deduplication, storage, and streaming for incidents."""
 
-    def __init__(self, redis_url: str, retention_seconds: int) -> None:
-        self.redis = redis.from_url(redis_url, decode_responses=True)
+    def __init__(
+        self,
+        redis_url: str,
+        retention_seconds: int,
+        max_connections: int = 32,
+        pool_timeout: float = 20.0,
+    ) -> None:
+        # A blocking pool makes callers wait for a free connection instead of raising
+        # once max_connections are checked out. Replies stay as bytes: msgspec decodes
+        # them directly without a UTF-8 pass.
+        pool = redis.BlockingConnectionPool.from_url(
+            redis_url,
+            decode_responses=False,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            health_check_interval=30,
+        )
+        self.redis = redis.Redis.from_pool(pool)
         self.retention_seconds = retention_seconds
-        self.zset_key = "crimetrend:incidents"
+        self.stream_key = "crimetrend:stream"
+        self.stream_field = b"incident"
         self.dedup_key_prefix = "crimetrend:dedup:"
-        self.pubsub_channel = "crimetrend:stream"
+        self._push_script = self.redis.register_script(_PUSH_SCRIPT)
 
     async def push(self, incident: Incident) -> bool:
-        """Store an incident if it is new and publish it to listeners."""
-
-        message = incident.to_message()
-        dedup_key = f"{self.dedup_key_prefix}{incident.id}"
-        added = await self.redis.set(dedup_key, 1, nx=True, ex=self.retention_seconds)
-        if not added:
-            return False
-
-        score = message["timestamp"]
-        score_value = datetime.fromisoformat(score.replace("Z", "+00:00")).timestamp()
-        await self.redis.zadd(self.zset_key, {json.dumps(message): score_value})
-        await self.redis.zremrangebyscore(
-            self.zset_key, "-inf", score_value - float(self.retention_seconds)
-        )
-        await self.redis.publish(self.pubsub_channel, json.dumps(message))
-        return True
+        """Store an incident if it is new and append it to the stream."""
+
+        return bool(await self.push_many([incident]))
+
+    async def push_many(self, incidents: Sequence[Incident]) -> int:
+        """Store the new incidents from a batch and append them to the stream.
+
+        Dedup and append run together in one server-side script, so a batch costs a
+        single round-trip and a failed push marks nothing as seen. Returns the number
+        stored.
+        """
+
+        if not incidents:
+            return 0
+
+        keys = [self.stream_key, *(f"{self.dedup_key_prefix}{incident.id}" for incident in incidents)]
+        args = [
+            self.retention_seconds,
+            self._retention_floor(),
+            self.stream_field,
+            *(_ENCODER.encode(incident.to_message()) for incident in incidents),
+        ]
+        return int(await self._push_script(keys=keys, args=args, client=self.redis))
 
     async def get_recent(self, since: Optional[datetime] = None) -> Iterable[Dict[str, str]]:
-        """Return a list of recent incidents since the provided timestamp."""
-
-        min_score = since.timestamp() if since else "-inf"
-        entries = await self.redis.zrangebyscore(self.zset_key, min_score, "+inf")
-        return [json.loads(entry) for entry in entries]
-
-    async def stream(self) -> AsyncIterator[Dict[str, str]]:
-        """Yield incidents published to the queue."""
-
-        pubsub = self.redis.pubsub()
-        await pubsub.subscribe(self.pubsub_channel)
-        try:
-            while True:
-                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                if not message:
-                    await asyncio.sleep(0.1)
-                    continue
-                data = json.loads(message["data"])
-                yield data
-        finally:
-            await pubsub.unsubscribe(self.pubsub_channel)
-            await pubsub.close()
+        """Return incidents added to the stream since the provided timestamp."""
+
+        min_id = str(int(since.timestamp() * 1000)) if since else "-"
+        entries = await self.redis.xrange(self.stream_key, min=min_id, max="+")
+        return [_DECODER.decode(fields[self.stream_field]) for _, fields in entries]
+
+    async def latest_id(self) -> bytes:
+        """Return the ID of the newest stream entry, or ``0-0`` when the stream is empty."""
+
+        entries = await self.redis.xrevrange(self.stream_key, count=1)
+        return entries[0][0] if entries else b"0-0"
+
+    async def stream(self, last_id: Union[str, bytes] = "$") -> AsyncIterator[Tuple[bytes, bytes]]:
+        """Yield ``(entry_id, payload)`` for incidents appended after ``last_id``.
+
+        Payloads are forwarded exactly as stored so fanout consumers never decode them;
+        passing the last yielded ID back in resumes without gaps.
+        """
+
+        while True:
+            response = await self.redis.xread({self.stream_key: last_id}, block=0, count=100)
+            for _, entries in response:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    yield entry_id, fields[self.stream_field]
+
+    def _retention_floor(self) -> str:
+        """Return the oldest stream ID that falls inside the retention window."""
+
+        return str(int((time.time() - self.retention_seconds) * 1000))
 
     async def close(self) -> None:
-        await self.redis.close()
+        await self.redis.aclose()
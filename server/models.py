@@ -1,10 +1,12 @@
 """Data models used by the CrimeTrend backend."""
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+import msgspec
+
 
 @dataclass(slots=True)
 class Incident:
@@ -24,6 +26,8 @@ class Incident:
     def to_message(self) -> Dict[str, Any]:
         """Convert the incident to a serialisable dictionary."""
 
-        payload = asdict(self)
-        payload["timestamp"] = self.timestamp.isoformat()
+        # Leave the datetime untouched so it is formatted once, as ``+00:00`` rather
+        # than msgspec's ``Z``.
+        payload = msgspec.to_builtins(self, builtin_types=(datetime,))
+        payload["timestamp"] = payload["timestamp"].isoformat()
         return payload
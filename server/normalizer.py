@@ -3,19 +3,40 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-import hashlib
-from typing import Any, Callable, Mapping, Optional
+import logging
+from typing import Any, Callable, Iterable, List, Mapping, Optional
+
+import xxhash
+from ciso8601 import parse_datetime
 
 from .models import Incident
 
+logger = logging.getLogger(__name__)
+
+# Dedup keys only need to be stable and collision-resistant, not cryptographic.
+HASHER: Callable[[bytes], str] = xxhash.xxh3_128_hexdigest
+
+
+_MISSING = object()
+
 
 def _parse_iso(value: str) -> datetime:
     """Parse ISO-8601 timestamps with graceful fallback."""
 
     try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+        parsed = parse_datetime(value)
     except ValueError:
         return datetime.now(tz=timezone.utc)
+    return parsed if parsed.tzinfo is timezone.utc else parsed.astimezone(timezone.utc)
+
+
+def _get_or_now(record: Mapping[str, Any], key: str) -> Any:
+    """Return ``record[key]``, only formatting the current time when the key is absent."""
+
+    value = record.get(key, _MISSING)
+    if value is _MISSING:
+        return datetime.now(tz=timezone.utc).isoformat()
+    return value
 
 
 @dataclass(slots=True)
@@ -46,6 +67,24 @@ class IncidentNormalizer:
             incident.audio_url = audio_url
         return incident
 
+    def normalize_batch(self, source: str, records: Iterable[Mapping[str, Any]]) -> List[Incident]:
+        """Normalise every record from one fetch of ``source``, resolving the handler once.
+
+        Records the handler cannot convert are logged and skipped so one malformed
+        row does not drop the rest of the fetch.
+        """
+
+        handler = self.handlers.get(source)
+        if handler is None:
+            raise KeyError(f"No normaliser registered for source '{source}'")
+        incidents = []
+        for record in records:
+            try:
+                incidents.append(handler(record))
+            except Exception as exc:
+                logger.warning("[%s] skipping malformed record: %r", source, exc)
+        return incidents
+
 
 # Handlers -----------------------------------------------------------------
 
@@ -64,18 +103,20 @@ def _build_incident(
 ) -> Incident:
     """Helper to construct incidents with consistent hashing."""
 
-    digest = hashlib.sha256(f"{source}:{record_id}:{timestamp}".encode()).hexdigest()
+    digest = HASHER(f"{source}:{record_id}:{timestamp}".encode())
+    # Positional arguments in Incident field order: this runs once per feed row and
+    # keyword construction of the dataclass costs several times more per call.
     return Incident(
-        id=digest,
-        timestamp=_parse_iso(timestamp),
-        type=category,
-        agency=agency,
-        address=address,
-        lat=float(lat),
-        lon=float(lon),
-        status=status,
-        source=source,
-        audio_url=audio_url,
+        digest,
+        _parse_iso(timestamp),
+        category,
+        agency,
+        address,
+        float(lat),
+        float(lon),
+        status,
+        source,
+        audio_url,
     )
 
 
@@ -83,7 +124,7 @@ def _socrata_handler(record: Mapping[str, Any]) -> Incident:
     return _build_incident(
         source="seattle",
         record_id=str(record.get("cad_cdw_id") or record.get("incident_number", "")),
-        timestamp=str(record.get("event_clearance_date") or record.get("datetime", datetime.now(tz=timezone.utc).isoformat())),
+        timestamp=str(record.get("event_clearance_date") or _get_or_now(record, "datetime")),
         category=str(record.get("event_clearance_description") or record.get("type", "Unknown")),
         agency="Seattle PD",
         address=str(record.get("incident_location") or record.get("address", "Unknown")),
@@ -98,7 +139,7 @@ def _pulsepoint_handler(record: Mapping[str, Any]) -> Incident:
     return _build_incident(
         source="pulsepoint",
         record_id=str(record.get("id")),
-        timestamp=str(record.get("lastUpdate") or record.get("timestamp", datetime.now(tz=timezone.utc).isoformat())),
+        timestamp=str(record.get("lastUpdate") or _get_or_now(record, "timestamp")),
         category=str(record.get("type", "Unknown")),
         agency=str(record.get("agency", "PulsePoint")),
         address=str(location.get("address", "Unknown")),
@@ -113,7 +154,7 @@ def _openmhz_handler(record: Mapping[str, Any]) -> Incident:
     return _build_incident(
         source="openmhz",
         record_id=str(record.get("id")),
-        timestamp=str(record.get("time") or record.get("timestamp", datetime.now(tz=timezone.utc).isoformat())),
+        timestamp=str(record.get("time") or _get_or_now(record, "timestamp")),
         category=str(meta.get("talkgroup", "Radio Call")),
         agency=str(meta.get("system", "OpenMHz")),
         address=str(meta.get("tag", "Unknown Location")),
@@ -128,7 +169,7 @@ def _noaa_handler(record: Mapping[str, Any]) -> Incident:
     geometry = record.get("geometry", {})
     coords = geometry.get("coordinates", [0.0, 0.0])
     props = record.get("properties", {})
-    timestamp = props.get("effective") or props.get("sent", datetime.now(tz=timezone.utc).isoformat())
+    timestamp = props.get("effective") or _get_or_now(props, "sent")
     return _build_incident(
         source="noaa",
         record_id=str(record.get("id")),
@@ -146,7 +187,7 @@ def _fema_handler(record: Mapping[str, Any]) -> Incident:
     return _build_incident(
         source="fema",
         record_id=str(record.get("disasterNumber")),
-        timestamp=str(record.get("declarationDate", datetime.now(tz=timezone.utc).isoformat())),
+        timestamp=str(_get_or_now(record, "declarationDate")),
         category=str(record.get("incidentType", "Disaster")),
         agency="FEMA",
         address=f"{record.get('state')}, {record.get('declaredCountyArea', 'Unknown County')}",
@@ -157,7 +198,7 @@ def _fema_handler(record: Mapping[str, Any]) -> Incident:
 
 
 def _lexisnexis_handler(record: Mapping[str, Any]) -> Incident:
-    timestamp = record.get("occured_on") or record.get("report_date", datetime.now(tz=timezone.utc).isoformat())
+    timestamp = record.get("occured_on") or _get_or_now(record, "report_date")
     return _build_incident(
         source="lexisnexis",
         record_id=str(record.get("case_number", record.get("id", ""))),
@@ -172,12 +213,12 @@ def _lexisnexis_handler(record: Mapping[str, Any]) -> Incident:
 
 
 def _twitter_handler(record: Mapping[str, Any]) -> Incident:
-    coordinates = record.get("data", {}).get("geo", {}).get("coordinates", {}).get("coordinates", [0.0, 0.0])
-    created_at = record.get("data", {}).get("created_at", datetime.now(tz=timezone.utc).isoformat())
+    data = record.get("data", {})
+    coordinates = data.get("geo", {}).get("coordinates", {}).get("coordinates", [0.0, 0.0])
     return _build_incident(
         source="twitter",
-        record_id=str(record.get("data", {}).get("id")),
-        timestamp=str(created_at),
+        record_id=str(data.get("id")),
+        timestamp=str(_get_or_now(data, "created_at")),
         category="Social Alert",
         agency=str(record.get("includes", {}).get("users", [{}])[0].get("username", "Twitter")),
         address=str(record.get("matching_rules", [{}])[0].get("tag", "Twitter Stream")),
@@ -0,0 +1,218 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import orjson
+import pytest
+from cachetools import TTLCache
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server import api_server
+
+
+class FlakyStreamQueue:
+    """Fails once after the first entry, then records where the reader resumed."""
+
+    def __init__(self) -> None:
+        self.resumed_from = []
+
+    async def latest_id(self) -> bytes:
+        return b"1-0"
+
+    async def stream(self, last_id):
+        self.resumed_from.append(last_id)
+        if len(self.resumed_from) == 1:
+            yield b"2-0", b"first"
+            raise ConnectionError("redis went away")
+        yield b"3-0", b"second"
+        await asyncio.Event().wait()
+
+
+class RecordingManager:
+    def __init__(self) -> None:
+        self.payloads = []
+
+    async def broadcast(self, payload: bytes) -> None:
+        self.payloads.append(payload)
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_resumes_from_last_delivered_entry(monkeypatch):
+    queue, manager = FlakyStreamQueue(), RecordingManager()
+    monkeypatch.setattr(api_server, "queue", queue)
+    monkeypatch.setattr(api_server, "manager", manager)
+    monkeypatch.setattr(api_server, "_BROADCAST_RETRY_SECONDS", 0)
+
+    task = asyncio.create_task(api_server._broadcast_incidents())
+    while len(manager.payloads) < 2:
+        await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert queue.resumed_from == [b"1-0", b"2-0"]
+    assert manager.payloads == [b"first", b"second"]
+
+
+class CountingQueue:
+    def __init__(self) -> None:
+        self.reads = []
+        self.fail = False
+
+    async def get_recent(self, since):
+        self.reads.append(since)
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ConnectionError("redis went away")
+        return [{"id": str(len(self.reads))}]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def recent(monkeypatch):
+    queue, clock = CountingQueue(), FakeClock()
+    monkeypatch.setattr(api_server, "queue", queue)
+    monkeypatch.setattr(api_server, "_recent_cache", TTLCache(maxsize=64, ttl=1.0, timer=clock))
+    return queue, clock
+
+
+def _params(since=None):
+    return api_server._QueryParams(since=since)
+
+
+@pytest.mark.asyncio
+async def test_get_recent_shares_one_read_across_concurrent_misses(recent):
+    queue, _ = recent
+
+    results = await asyncio.gather(*(api_server.get_recent(_params()) for _ in range(5)))
+
+    assert len(queue.reads) == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_get_recent_floors_cursor_to_the_second(recent):
+    queue, _ = recent
+    base = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+    first = await api_server.get_recent(_params(base + timedelta(milliseconds=200)))
+    second = await api_server.get_recent(_params((base + timedelta(milliseconds=900)).replace(tzinfo=None)))
+    await api_server.get_recent(_params(base + timedelta(seconds=1)))
+
+    assert first is second
+    assert orjson.loads(first) == [{"id": "1"}]
+    assert queue.reads == [base, base + timedelta(seconds=1)]
+
+
+@pytest.mark.asyncio
+async def test_get_recent_rereads_after_expiry(recent):
+    queue, clock = recent
+
+    await api_server.get_recent(_params())
+    clock.now = 0.5
+    await api_server.get_recent(_params())
+    clock.now = 1.5
+    await api_server.get_recent(_params())
+
+    assert len(queue.reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_recent_does_not_cache_failed_reads(recent):
+    queue, _ = recent
+    queue.fail = True
+    with pytest.raises(ConnectionError):
+        await api_server.get_recent(_params())
+
+    queue.fail = False
+    assert orjson.loads(await api_server.get_recent(_params())) == [{"id": "2"}]
+
+
+class BlockingSocket:
+    """Accepts the first frame, then blocks until released."""
+
+    def __init__(self) -> None:
+        self.sent = []
+        self.release = asyncio.Event()
+
+    async def send_bytes(self, payload: bytes) -> None:
+        self.sent.append(payload)
+        await self.release.wait()
+
+
+class BrokenSocket:
+    def __init__(self) -> None:
+        self.close_codes = []
+
+    async def send_bytes(self, payload: bytes) -> None:
+        raise RuntimeError("socket closed")
+
+    async def close(self, code: int) -> None:
+        self.close_codes.append(code)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_oldest_frames_for_a_stalled_client():
+    manager = api_server.ConnectionManager(max_pending=3)
+    socket = BlockingSocket()
+    manager.connect(socket)
+    outbox, writer = manager.clients[socket]
+
+    await manager.broadcast(b"0")
+    await _settle()
+    for index in range(1, 6):
+        await manager.broadcast(str(index).encode())
+
+    assert socket.sent == [b"0"]
+    assert outbox.qsize() == 3
+    assert [outbox.get_nowait() for _ in range(3)] == [b"3", b"4", b"5"]
+
+    manager.disconnect(socket)
+    await _settle()
+    assert writer.cancelled()
+    assert socket not in manager.clients
+
+
+@pytest.mark.asyncio
+async def test_writer_failure_removes_client():
+    manager = api_server.ConnectionManager()
+    socket = BrokenSocket()
+    manager.connect(socket)
+    _, writer = manager.clients[socket]
+
+    await manager.broadcast(b"payload")
+    await _settle()
+
+    assert writer.done()
+    assert socket not in manager.clients
+    assert socket.close_codes == [1011]
+
+
+def test_incidents_endpoint_returns_queued_rows(recent):
+    queue, _ = recent
+    client = TestClient(api_server.app)
+
+    response = client.get("/incidents")
+    repeat = client.get("/incidents")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [{"id": "1"}]
+    assert repeat.content == response.content
+    assert len(queue.reads) == 1
+    schema = client.get("/openapi.json").json()["paths"]["/incidents"]["get"]["responses"]["200"]
+    assert schema["content"]["application/json"]["schema"]["items"]["$ref"].endswith("/IncidentResponse")
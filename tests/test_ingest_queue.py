@@ -0,0 +1,96 @@
+import os
+import sys
+
+import fakeredis
+import pytest
+from redis import exceptions as redis_exceptions
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.ingest_queue import IngestQueue
+from server.normalizer import IncidentNormalizer
+
+
+def _incident(record_id: str):
+    record = {"cad_cdw_id": record_id, "event_clearance_date": "2024-01-01T10:00:00Z"}
+    return IncidentNormalizer.default().normalize("seattle", record)
+
+
+@pytest.fixture
+def queue():
+    queue = IngestQueue("redis://localhost:6379/0", retention_seconds=3600)
+    queue.redis = fakeredis.FakeAsyncRedis()
+    return queue
+
+
+@pytest.mark.asyncio
+async def test_push_many_ignores_empty_batch(queue):
+    assert await queue.push_many([]) == 0
+    assert await queue.redis.exists(queue.stream_key) == 0
+
+
+@pytest.mark.asyncio
+async def test_push_many_stores_in_batch_duplicates_once(queue):
+    first, second = _incident("C1"), _incident("C2")
+
+    assert await queue.push_many([first, second, first]) == 2
+
+    stored = await queue.get_recent()
+    assert [item["id"] for item in stored] == [first.id, second.id]
+
+
+@pytest.mark.asyncio
+async def test_push_many_skips_incidents_already_seen(queue):
+    seen, new = _incident("C1"), _incident("C3")
+    assert await queue.push(seen) is True
+
+    assert await queue.push_many([seen, new]) == 1
+    assert await queue.push_many([seen, new]) == 0
+
+    stored = await queue.get_recent()
+    assert [item["id"] for item in stored] == [seen.id, new.id]
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_after_last_yielded_id(queue):
+    assert await queue.latest_id() == b"0-0"
+    first, second = _incident("C1"), _incident("C2")
+    await queue.push_many([first, second])
+
+    reader = queue.stream(b"0-0")
+    first_id, _ = await reader.__anext__()
+    await reader.aclose()
+
+    entry_id, payload = await queue.stream(first_id).__anext__()
+    assert second.id.encode() in payload
+    assert entry_id == await queue.latest_id()
+
+
+@pytest.mark.asyncio
+async def test_push_many_retry_stores_batch_after_failed_push(queue, monkeypatch):
+    incidents = [_incident("C1"), _incident("C2")]
+    evalsha = queue.redis.evalsha
+
+    async def fail_once(*args, **kwargs):
+        monkeypatch.setattr(queue.redis, "evalsha", evalsha)
+        raise ConnectionError("redis went away")
+
+    monkeypatch.setattr(queue.redis, "evalsha", fail_once)
+    with pytest.raises(ConnectionError):
+        await queue.push_many(incidents)
+
+    assert await queue.push_many(incidents) == 2
+    assert [item["id"] for item in await queue.get_recent()] == [incident.id for incident in incidents]
+
+
+@pytest.mark.asyncio
+async def test_push_many_leaves_no_dedup_key_when_append_fails(queue):
+    incident = _incident("C1")
+    await queue.redis.set(queue.stream_key, "not a stream")
+
+    with pytest.raises(redis_exceptions.ResponseError):
+        await queue.push_many([incident])
+    assert await queue.redis.exists(f"{queue.dedup_key_prefix}{incident.id}") == 0
+
+    await queue.redis.delete(queue.stream_key)
+    assert await queue.push_many([incident]) == 1
@@ -1,12 +1,14 @@
 import os
 import sys
 
+import fakeredis
 import pytest
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from server.data_ingestor import DataCollector, DataSource
 from server.config import Settings
+from server.ingest_queue import IngestQueue
 from server.models import Incident
 from server.normalizer import IncidentNormalizer
 
@@ -18,6 +20,11 @@ class StubQueue:
     async def push(self, incident: Incident) -> None:
         self.messages.append(incident.to_message())
 
+    async def push_many(self, incidents) -> int:
+        for incident in incidents:
+            await self.push(incident)
+        return len(incidents)
+
 
 @pytest.mark.asyncio
 async def test_collector_processes_mocked_feed():
@@ -61,3 +68,106 @@ async def test_collector_processes_mocked_feed():
     assert first["agency"] == "Seattle PD"
     assert first["status"] == "dispatched"
     assert first["timestamp"] == "2024-01-01T10:00:00+00:00"
+
+
+class StubResponse:
+    def __init__(self, status, payload=None, headers=None) -> None:
+        self.status = status
+        self.payload = payload
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self) -> None:
+        assert self.status < 400
+
+    async def json(self):
+        return self.payload
+
+
+class ConditionalSession:
+    """Serves one payload with an ETag and answers 304 when it is echoed back."""
+
+    def __init__(self, payload) -> None:
+        self.payload = payload
+        self.request_headers = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.request_headers.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return StubResponse(304)
+        return StubResponse(
+            200, self.payload, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        )
+
+
+def _build_collector(queue, session):
+    settings = Settings(redis_url="redis://localhost:6379/0", open_data_apis=["seattle"], refresh_interval=1)
+    source = DataSource(name="seattle", url="https://example", interval=0)
+    collector = DataCollector(settings=settings, queue=queue, sources=[source])
+    collector._session = session
+    return collector, source
+
+
+SEATTLE_ROW = {
+    "cad_cdw_id": "B1",
+    "event_clearance_date": "2024-01-01T10:00:00Z",
+    "latitude": 47.0,
+    "longitude": -122.0,
+}
+
+
+@pytest.mark.asyncio
+async def test_poll_skips_unchanged_feed_after_success():
+    queue = StubQueue()
+    session = ConditionalSession([SEATTLE_ROW])
+    collector, source = _build_collector(queue, session)
+
+    await collector._poll(source)
+    await collector._poll(source)
+
+    assert len(queue.messages) == 1
+    assert "If-None-Match" not in session.request_headers[0]
+    assert session.request_headers[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+
+@pytest.mark.asyncio
+async def test_poll_refetches_feed_when_ingestion_fails(monkeypatch):
+    queue = IngestQueue("redis://localhost:6379/0", retention_seconds=3600)
+    queue.redis = fakeredis.FakeAsyncRedis()
+    evalsha = queue.redis.evalsha
+
+    async def fail_once(*args, **kwargs):
+        monkeypatch.setattr(queue.redis, "evalsha", evalsha)
+        raise ConnectionError("redis unavailable")
+
+    monkeypatch.setattr(queue.redis, "evalsha", fail_once)
+    session = ConditionalSession([SEATTLE_ROW])
+    collector, source = _build_collector(queue, session)
+
+    with pytest.raises(ConnectionError):
+        await collector._poll(source)
+    await collector._poll(source)
+
+    assert "If-None-Match" not in session.request_headers[1]
+    assert len(await queue.get_recent()) == 1
+
+
+@pytest.mark.asyncio
+async def test_process_records_skips_malformed_rows():
+    queue = StubQueue()
+    collector, _ = _build_collector(queue, session=None)
+    bad_row = dict(SEATTLE_ROW, cad_cdw_id="B2", latitude="n/a")
+    good_row = dict(SEATTLE_ROW, cad_cdw_id="B3")
+
+    await collector._process_records("seattle", [SEATTLE_ROW, bad_row, good_row])
+
+    assert [message["lat"] for message in queue.messages] == [47.0, 47.0]
+    assert len({message["id"] for message in queue.messages}) == 2